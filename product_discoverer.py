@@ -2,23 +2,58 @@ import os
 import re
 import sys
 import subprocess
-from urllib.parse import urljoin, urlparse, urlencode, parse_qs, urlunparse
-from collections import deque
+from urllib.parse import urljoin, urlsplit, urlunsplit
 import asyncio
 import aiohttp
 
 from aiohttp import ClientSession
 from fastapi import FastAPI, BackgroundTasks, HTTPException
 from fastapi.responses import FileResponse
-from bs4 import BeautifulSoup
 from pydantic import BaseModel, Field
-from playwright.async_api import async_playwright
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from pybloom_live import ScalableBloomFilter
+from selectolax.parser import HTMLParser
 
 app = FastAPI()
 
 OUTPUT_DIR = f"{os.path.expanduser('~')}/Documents/product-discoverer/output_files"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+# Shared aiohttp session (connection pool) for plain HTTP fetches
+_http_session = None
+
+# Cap on concurrent HEAD requests while validating domains
+_validate_sem = None
+
+def get_http_session() -> ClientSession:
+    """
+    Return the process-wide aiohttp session, creating it on first use.
+    Reusing one session keeps TCP/TLS connections alive across requests.
+    """
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=10, ttl_dns_cache=300)
+        )
+    return _http_session
+
+def get_validate_semaphore() -> asyncio.Semaphore:
+    """
+    Return the process-wide semaphore bounding domain validation, creating it
+    on first use so it binds to the running event loop (not the import-time
+    one, which differs under 'python product_discoverer.py' on Python 3.9).
+    """
+    global _validate_sem
+    if _validate_sem is None:
+        _validate_sem = asyncio.Semaphore(50)
+    return _validate_sem
+
+@app.on_event("shutdown")
+async def close_http_session():
+    """Close the shared aiohttp session when the app shuts down."""
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+
 def ensure_playwright_installed():
     """
     Ensure that Playwright is installed and the necessary browsers are set up.
@@ -42,6 +77,14 @@ def ensure_playwright_installed():
         # Run 'playwright install' which installs chromium, firefox, and webkit by default
         subprocess.run(["playwright", "install"], check=True)
 
+@app.on_event("startup")
+async def install_playwright_on_startup():
+    """
+    Check/install Playwright once when the app starts, rather than per crawl
+    request. Runs in a thread so a pip install doesn't block the event loop.
+    """
+    await asyncio.to_thread(ensure_playwright_installed)
+
 async def loader(domain: str, interval: int = 5):
     """
     Periodically print a loading message for a given domain.
@@ -64,180 +107,408 @@ async def loader(domain: str, interval: int = 5):
 # Step 1: Headless Browser Fetch (with optional infinite scroll)
 ################################################################################
 
-async def fetch_html_headless(url: str, scroll_wait: float = 1.5, max_scrolls: int = 5):
+class BrowserPool:
+    """
+    Async context manager that starts Playwright and launches a single
+    headless Chromium browser, shared by every page fetch of a crawl.
+
+    Images are disabled through a Blink setting rather than request routing,
+    because routing turns off the browser's HTTP cache.
+
+    Usage:
+        async with BrowserPool() as pool:
+            context = await pool.browser.new_context()
+            html = await fetch_html_headless(url, context)
+    """
+
+    def __init__(self):
+        self._pw = None
+        self.browser = None
+
+    async def __aenter__(self):
+        # Playwright must be installed: 'pip install playwright'
+        # and you must run 'playwright install' once to install browser engines.
+        self._pw = await async_playwright().start()
+        try:
+            self.browser = await self._pw.chromium.launch(
+                headless=True,
+                args=["--blink-settings=imagesEnabled=false"],
+            )
+        except BaseException:
+            # __aexit__ isn't called when __aenter__ fails: stop the driver here
+            await self._pw.stop()
+            self._pw = None
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.browser is not None:
+            await self.browser.close()
+        if self._pw is not None:
+            await self._pw.stop()
+
+
+# Requests that never affect the set of anchors on a page
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+BLOCKED_HOSTS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net",
+    "facebook.net", "hotjar.com", "clarity.ms", "criteo.com",
+)
+
+
+async def block_non_document_requests(route):
+    """
+    Playwright route handler that aborts images, fonts, media, stylesheets
+    and known analytics/ad hosts, and lets everything else through.
+
+    Note: any routing disables the browser's HTTP cache for the context.
+    """
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        host in urlsplit(request.url).netloc for host in BLOCKED_HOSTS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def fetch_html_headless(url: str, context, scroll_wait: float = 1.5, max_scrolls: int = 20):
     """
     Uses Playwright in headless mode to open a page, optionally perform
     'infinite scroll', and then return the final rendered HTML.
 
+    Scrolling stops early once two consecutive scrolls have not grown the
+    page within scroll_wait, so short pages don't pay for max_scrolls waits.
+
     Args:
         url (str): The URL to load.
-        scroll_wait (float): Seconds to wait between scroll steps.
+        context (BrowserContext): The crawl's shared browser context (shares its HTTP cache).
+        scroll_wait (float): Max seconds to wait for the page to grow after each scroll.
         max_scrolls (int): How many times to scroll to bottom (limit for safety).
 
     Returns:
         str | None: The final HTML after scrolling, or None if error.
     """
-    # Playwright must be installed: 'pip install playwright' 
-    # and you must run 'playwright install' once to install browser engines.
+    page = None
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            await page.goto(url)
-
-            # Simple approach to "infinite scroll" a fixed number of times.
-            # If the site needs more scrolling to load everything,
-            # increase max_scrolls or detect when there's no new content.
-            for _ in range(max_scrolls):
-                # Scroll to bottom
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(scroll_wait)
-            
-            # Get final rendered HTML
-            html = await page.content()
-            await browser.close()
-            return html
+        page = await context.new_page()
+        await page.goto(url)
+
+        # "Infinite scroll" until the page stops growing (or max_scrolls is hit)
+        stable = 0
+        for _ in range(max_scrolls):
+            height = await page.evaluate("document.body.scrollHeight")
+
+            # Scroll to bottom, then wait up to scroll_wait for new content
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            try:
+                await page.wait_for_function(
+                    "h => document.body.scrollHeight > h",
+                    arg=height,
+                    timeout=scroll_wait * 1000,
+                )
+                stable = 0
+            except PlaywrightTimeoutError:
+                # Nothing loaded within scroll_wait
+                stable += 1
+                if stable >= 2:
+                    break
+
+        # Get final rendered HTML
+        return await page.content()
     except Exception as e:
         print(f"[Headless Error] Could not fetch {url}: {e}")
         return None
+    finally:
+        if page is not None:
+            await page.close()
+
+
+# Heuristics deciding whether a plain HTTP response needs JS rendering
+FAST_PATH_MIN_BYTES = 2048
+FAST_PATH_MIN_LINKS = 10
+SPA_ROOT_MARKERS = ('<div id="root"></div>', '<div id="app"></div>', '<div id="__next"></div>')
+
+
+async def fetch_html_fast(url: str, session: ClientSession):
+    """
+    Fetch the raw (unrendered) HTML of a page with a plain HTTP GET.
+
+    Args:
+        url (str): The URL to load.
+        session (ClientSession): The shared aiohttp session.
+
+    Returns:
+        str | None: The response body, or None if the request failed.
+    """
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            if response.status >= 400:
+                return None
+            return await response.text()
+    except Exception as e:
+        print(f"[Fast Fetch Error] Could not fetch {url}: {e}")
+        return None
+
+
+def needs_js_render(html: str) -> bool:
+    """
+    Guess whether a raw HTML body is an empty client-side-rendered shell
+    that has to go through the headless browser to expose its links.
+    """
+    if len(html) < FAST_PATH_MIN_BYTES:
+        return True
+    if any(marker in html for marker in SPA_ROOT_MARKERS):
+        return True
+    return html.count("<a ") + html.count("<A ") < FAST_PATH_MIN_LINKS
 
 
 ################################################################################
 # Step 2: BFS-based extraction, but each page load uses the headless browser
 ################################################################################
 
+# Regex to exclude unwanted paths (bytes pattern, matched against the
+# lowercased ASCII path, so no case folding is needed)
+EXCLUDE_RE = re.compile(
+    rb"chat|contact|reward|profile|club|write-to-us|return|payment|help|service|"
+    rb"user-agreement|policies|aboutus|history|blog|account|wishlist|viewcart|login|logout"
+)
+# Skip images and documents
+EXCLUDE_EXTS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".svg", ".webp", ".ico", ".pdf", ".docx"})
+# Ports dropped from normalized URLs
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+def extract_links(html: str, base_url: str, domain_host: str) -> list[str]:
+    """
+    Extract, filter and normalize the same-domain links of a page.
+
+    Pure CPU work with no shared state, so it can run in a worker thread
+    (asyncio.to_thread) without blocking the event loop.
+
+    Args:
+        html (str): The page HTML.
+        base_url (str): The page URL, used to resolve relative hrefs.
+        domain_host (str): The crawl's hostname, lowercased, without a leading "www.".
+
+    Returns:
+        list[str]: Normalized URLs, each at most once, in page order.
+    """
+    allowed_hosts = {domain_host, "www." + domain_host}
+    subdomain_suffix = "." + domain_host
+
+    links = []
+    seen_raw = set()  # raw hrefs already handled on this page (nav, pagination, ...)
+    seen_links = set()
+    tree = HTMLParser(html)
+    for node in tree.css("a[href]"):
+        href = (node.attributes.get("href") or "").strip()
+
+        # 0) Skip empty and repeated hrefs before any normalization work
+        if not href or href in seen_raw:
+            continue
+        seen_raw.add(href)
+
+        # 1) Build absolute URL (skip only this href if it is malformed,
+        #    e.g. "http://[bad/x" raises ValueError: Invalid IPv6 URL)
+        try:
+            full_url = urljoin(base_url, href)
+            if full_url.endswith(":"):
+                full_url = full_url[:-1]
+
+            parsed_url = urlsplit(full_url)
+        except ValueError:
+            continue
+
+        # 2) Skip non-http/https (also covers javascript:, mailto:, tel:)
+        if parsed_url.scheme not in ("http", "https"):
+            continue
+
+        # 3) Check domain: the domain itself, its www. host, or a subdomain
+        # (hostname is lowercased and has no port or userinfo)
+        host = parsed_url.hostname
+        if not host or not (host in allowed_hosts or host.endswith(subdomain_suffix)):
+            continue
+
+        # 4) Skip images
+        path_lc = parsed_url.path.lower()
+        if os.path.splitext(path_lc)[1] in EXCLUDE_EXTS:
+            continue
+
+        # 5) Skip excluded paths (regex: most expensive filter, so last)
+        if EXCLUDE_RE.search(path_lc.encode("ascii", "ignore")):
+            continue
+
+        # 6) Normalize (the only URL rebuild): rebuild the netloc from the
+        #    lowercased host (no userinfo, no default port), drop trailing
+        #    slashes, sort the raw query pairs and drop any # fragment
+        try:
+            port = parsed_url.port
+        except ValueError:
+            continue
+        netloc = f"[{host}]" if ":" in host else host
+        if port is not None and port != DEFAULT_PORTS[parsed_url.scheme]:
+            netloc += f":{port}"
+        query = parsed_url.query
+        normalized_query = "&".join(sorted(query.split("&"))) if query else ""
+        normalized_url = parsed_url._replace(
+            netloc=netloc, path=parsed_url.path.rstrip("/"), query=normalized_query, fragment=""
+        ).geturl().rstrip("/")
+
+        # 7) Return each normalized URL once per page
+        if normalized_url not in seen_links:
+            seen_links.add(normalized_url)
+            links.append(normalized_url)
+
+    return links
+
+
 async def extract_product_urls_headless(
     domain: str,
     output_file: str,
+    browser,
     max_concurrency: int = 5,
     chunk_size: int = 500,
-    max_scrolls: int = 5
+    max_scrolls: int = 20,
+    use_fast_path: bool = True,
+    block_resources: bool = False
 ) -> int:
     """
     BFS crawl for all links on the given domain, using a headless browser
-    for each page to handle JavaScript/infinite scrolling.
+    for each page to handle JavaScript/infinite scrolling. With use_fast_path,
+    pages are first fetched over plain HTTP and only rendered in the browser
+    when the raw HTML looks like it needs JavaScript (see needs_js_render).
 
-    This version uses two sets:
-      - discovered:  to avoid adding duplicates to the queue/output file
-      - visited:     to avoid re-fetching the same URL
+    Deduplication uses a single structure:
+      - discovered:  a scalable Bloom filter, to avoid adding duplicates to the
+                     queue/output file using ~1 byte per URL instead of storing
+                     every URL string (a rare false positive drops that URL).
+                     A URL is queued only after passing this check, so each
+                     URL is fetched at most once without a separate visited set.
 
     Args:
         domain (str): The starting domain or URL.
-        output_file (str): Path where discovered URLs will be written.
-        max_concurrency (int): Max parallel fetches.
-        chunk_size (int): Write URLs to file in chunks of this size.
-        max_scrolls (int): How many times to scroll each page.
+        output_file (str): Path where discovered URLs will be written
+            (truncated when the crawl starts).
+        browser (Browser): The shared Playwright browser used for every fetch.
+        max_concurrency (int): Max parallel fetches (number of fetch workers).
+        chunk_size (int): Write URLs to file in batches of this size.
+        max_scrolls (int): Max times to scroll each page (stops early when the page stops growing).
+        use_fast_path (bool): Try a plain HTTP fetch before the headless browser.
+        block_resources (bool): Abort non-document requests in the browser
+            (see block_non_document_requests). Saves bandwidth but turns off
+            the shared HTTP cache, so it pays off mostly on image-heavy sites.
 
     Returns:
         int: Total count of unique URLs discovered.
     """
 
-    # Regex to exclude unwanted paths
-    exclude_pattern = re.compile(
-        r"chat|contact|reward|profile|club|write-to-us|return|payment|help|service|"
-        r"user-agreement|policies|aboutus|history|blog|account|wishlist|viewcart|login|logout",
-        re.IGNORECASE,
-    )
-    # Skip images
-    exclude_extensions = (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".svg", ".webp", ".ico", ".pdf", ".docx")
-
     # Prepare BFS structures
-    queue = deque([domain])
-    discovered = set([domain])  # Immediately mark domain as discovered
-    visited = set()
-    chunk_list = []
+    discovered = ScalableBloomFilter(
+        initial_capacity=100_000,
+        error_rate=1e-4,
+        mode=ScalableBloomFilter.LARGE_SET_GROWTH,
+    )
+    discovered.add(domain)  # Immediately mark domain as discovered
     total_count = 1  # domain is counted as first discovered
 
     # Domain check
-    parsed_domain = urlparse(domain)
-    domain_netloc = parsed_domain.netloc.replace("www.", "")
-
-    # Concurrency limit
-    semaphore = asyncio.Semaphore(max_concurrency)
-
-    def flush_chunk():
-        nonlocal chunk_list
-        if chunk_list:
-            print(f"[WRITER] Writing {len(chunk_list)} urls ...")
-            with open(output_file, "a", encoding="utf-8") as f:
-                f.write("\n".join(chunk_list) + "\n")
-            chunk_list.clear()
-
-    # Write initial domain to file so we see it as discovered
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(domain + "\n")
-
-    while queue:
-        current_url = queue.popleft()
-
-        # If we've already fetched and processed this URL, skip
-        if current_url in visited:
-            continue
-
-        # Acquire concurrency slot
-        async with semaphore:
-            html = await fetch_html_headless(current_url, max_scrolls=max_scrolls)
-
-        # Mark it as visited after we attempt to fetch
-        visited.add(current_url)
-
-        if not html:
-            # If no HTML, skip deeper parsing
-            continue
+    parsed_domain = urlsplit(domain)
+    domain_host = (parsed_domain.hostname or "").removeprefix("www.")
 
-        # Parse HTML
-        soup = BeautifulSoup(html, "html.parser")
-        for link in soup.find_all("a", href=True):
-            href = link["href"].strip()
+    # One buffered handle for the whole crawl. Opened before any browser
+    # work so a bad output path fails immediately.
+    outf = open(output_file, "w", encoding="utf-8", buffering=1024 * 1024)
 
-            # 1) Skip javascript: links
-            if href.lower().startswith("javascript:"):
-                continue
+    # URLs waiting to be fetched; every worker both consumes and feeds it
+    url_queue = asyncio.Queue()
 
-            # 2) Build absolute URL
-            full_url = urljoin(current_url, href)
-            if full_url.endswith(":"):
-                full_url = full_url[:-1]
-
-            parsed_url = urlparse(full_url)
-
-            # 3) Skip non-http/https
-            if parsed_url.scheme not in ("http", "https"):
-                continue
+    # Discovered URLs waiting to be written; None tells the writer to stop
+    write_queue = asyncio.Queue()
 
-            # 4) Check domain (using substring check)
-            if domain_netloc not in parsed_url.netloc.replace("www.", ""):
-                continue
+    async def writer():
+        # Sole writer of the output file. Batches are written in a worker
+        # thread, so the crawl workers never wait on disk.
+        batch = []
+        while True:
+            url = await write_queue.get()
+            if url is None:
+                # Flush leftover batch
+                await asyncio.to_thread(outf.writelines, batch)
+                break
+            batch.append(url + "\n")
+            if len(batch) >= chunk_size:
+                print(f"[WRITER] Writing {len(batch)} urls ...")
+                await asyncio.to_thread(outf.writelines, batch)
+                batch = []
+
+    async def worker():
+        # No locks needed: everything runs on one event loop, and a URL is
+        # marked discovered before it is queued so it is never queued twice.
+        nonlocal total_count
+        while True:
+            current_url = await url_queue.get()
+            try:
+                html = None
+                if use_fast_path:
+                    html = await fetch_html_fast(current_url, get_http_session())
+                if html is None or needs_js_render(html):
+                    html = await fetch_html_headless(current_url, context, max_scrolls=max_scrolls)
+
+                if not html:
+                    # If no HTML, skip deeper parsing
+                    continue
+
+                # Parse HTML off the event loop
+                new_links = await asyncio.to_thread(extract_links, html, current_url, domain_host)
+                for normalized_url in new_links:
+                    # Only if not discovered, mark it, then queue it for crawling + writing
+                    if normalized_url not in discovered:
+                        discovered.add(normalized_url)  # avoid duplicates in output
+                        url_queue.put_nowait(normalized_url)
+                        write_queue.put_nowait(normalized_url)
+                        total_count += 1
+            except Exception as e:
+                print(f"[Worker Error] Could not process {current_url}: {e}")
+            finally:
+                url_queue.task_done()
+
+    context = None
+    writer_task = None
+    workers = []
 
-            # 5) Skip images
-            if parsed_url.path.lower().endswith(exclude_extensions):
-                continue
+    try:
+        # One context for the whole crawl so every page shares the HTTP cache
+        # (JS/CSS bundles are downloaded once); each fetch opens its own page.
+        context = await browser.new_context()
+        if block_resources:
+            await context.route("**/*", block_non_document_requests)
 
-            # 6) Skip # anchors
-            if "#" in parsed_url.geturl():
-                continue
+        writer_task = asyncio.create_task(writer())
 
-            # 7) Skip excluded paths
-            if exclude_pattern.search(parsed_url.path):
-                continue
+        # Write initial domain to file so we see it as discovered
+        write_queue.put_nowait(domain)
 
-            # 8) Normalize query
-            query_dict = dict(parse_qs(parsed_url.query))
-            normalized_query = urlencode(query_dict, doseq=True)
-            normalized_url = parsed_url._replace(query=normalized_query).geturl().rstrip("/")
+        url_queue.put_nowait(domain)
+        workers = [asyncio.create_task(worker()) for _ in range(max_concurrency)]
 
-            # 9) Only if not discovered, add to queue + file chunk
-            if normalized_url not in discovered:
-                discovered.add(normalized_url)  # avoid duplicates in output
-                queue.append(normalized_url)
-                chunk_list.append(normalized_url)
-                total_count += 1
+        # Done once every queued URL has been fetched and parsed
+        await url_queue.join()
+    finally:
+        # Stop the (now idle) workers
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
 
-                if len(chunk_list) >= chunk_size:
-                    flush_chunk()
+        if context is not None:
+            await context.close()
 
-    # Flush leftover chunk
-    flush_chunk()
+        # Let the writer drain its queue, then close the file
+        try:
+            if writer_task is not None:
+                write_queue.put_nowait(None)
+                await writer_task
+        finally:
+            outf.close()
 
     return total_count
 
@@ -246,33 +517,47 @@ async def extract_product_urls_headless(
 # Step 3: Tying it together in a single domain crawl function
 ################################################################################
 
-async def crawl_domain_headless(domain: str):
+def output_file_for(domain: str) -> str:
+    """
+    Path of the results file for a domain, named after its second host label
+    (e.g. "https://www.dribbble.com" -> OUTPUT_DIR/dribbble.txt).
+
+    Args:
+        domain (str): The domain or URL, with or without a scheme.
+    """
+    # urlsplit only finds the host after "//", so add it for bare domains
+    netloc = urlsplit(domain if "://" in domain else "//" + domain).netloc
+    try:
+        filename_part = netloc.split(".")[1]
+    except IndexError:
+        filename_part = netloc
+
+    return os.path.join(OUTPUT_DIR, f"{filename_part}.txt")
+
+async def crawl_domain_headless(domain: str, block_resources: bool = False):
     """
     Crawl a domain using a headless browser to handle JS/infinite scroll.
+
+    Args:
+        domain (str): The domain to crawl.
+        block_resources (bool): Abort non-document requests in the browser
+            (see extract_product_urls_headless).
     """
     
     loader_task = asyncio.create_task(loader(domain))
 
     try:
         # Output file name
-        domain_part = domain.replace("https://", "").replace("http://", "")
-        try:
-            filename_part = domain_part.split(".")[1]
-        except IndexError:
-            filename_part = domain_part
-
-        output_file = os.path.join(
-            OUTPUT_DIR, f"{filename_part}.txt"
-        )
+        output_file = output_file_for(domain)
 
-        # Clear out any existing file
-        open(output_file, "w").close()
-
-        # Run BFS with headless fetch
-        total_found = await extract_product_urls_headless(
-            domain=domain,
-            output_file=output_file
-        )
+        # Run BFS with headless fetch, reusing one browser for every page
+        async with BrowserPool() as pool:
+            total_found = await extract_product_urls_headless(
+                domain=domain,
+                output_file=output_file,
+                browser=pool.browser,
+                block_resources=block_resources
+            )
 
         print(f"Completed headless crawl of {domain}. Found {total_found} URLs.")
         print(f"Results in {output_file}")
@@ -302,12 +587,12 @@ async def validate_domains(domains: list[str]):
     
     def ensure_protocol_and_www(url):
         # Parse the URL
-        parsed_url = urlparse(url)
+        parsed_url = urlsplit(url)
         
         # Add scheme (http/https) if missing
         if not parsed_url.scheme:
             url = "https://" + url
-            parsed_url = urlparse(url)  # Re-parse after adding the scheme
+            parsed_url = urlsplit(url)  # Re-parse after adding the scheme
 
         # Add www. if missing
         netloc = parsed_url.netloc
@@ -315,27 +600,27 @@ async def validate_domains(domains: list[str]):
             netloc = "www." + netloc
 
         # Reconstruct the URL with the modified netloc
-        updated_url = urlunparse(
-            (parsed_url.scheme, netloc, parsed_url.path, parsed_url.params, parsed_url.query, parsed_url.fragment)
+        updated_url = urlunsplit(
+            (parsed_url.scheme, netloc, parsed_url.path, parsed_url.query, parsed_url.fragment)
         )
         return updated_url
 
     # Add https:// and www. to domains if missing
     updated_domains = [ensure_protocol_and_www(domain) for domain in domains]
 
-    invalid_urls = []
-    
     async def check_url(url: str, session: ClientSession):
+        # Returns the URL if it is invalid/unreachable, otherwise None
         try:
-            async with session.head(url, timeout=60) as response:
-                if response.status >= 400:
-                    invalid_urls.append(url)
+            async with get_validate_semaphore(), session.head(
+                url, timeout=aiohttp.ClientTimeout(total=15), allow_redirects=True
+            ) as response:
+                return url if response.status >= 400 else None
         except Exception:
-            invalid_urls.append(url)
+            return url
 
-    async with aiohttp.ClientSession() as session:
-        tasks = [check_url(domain, session) for domain in updated_domains]
-        await asyncio.gather(*tasks)
+    session = get_http_session()
+    tasks = [check_url(domain, session) for domain in updated_domains]
+    invalid_urls = [url for url in await asyncio.gather(*tasks) if url]
 
     if invalid_urls:
         raise HTTPException(
@@ -351,9 +636,12 @@ class CrawlRequest(BaseModel):
 
     Attributes:
         domains (list[str]): list of domain names to crawl.
+        block_resources (bool): Abort fonts, media, stylesheets and tracker
+            requests while rendering (disables the browser's HTTP cache).
     """
     
     domains: list[str] = Field(..., min_items=10)
+    block_resources: bool = False
 
 # API endpoint to start crawling
 @app.post("/crawl/")
@@ -370,11 +658,9 @@ async def start_crawling(request: CrawlRequest, background_tasks: BackgroundTask
     """
 
     updated_domains = await validate_domains(request.domains)
-    
-    ensure_playwright_installed()  # Dynamically install playwright if needed
 
     for domain in updated_domains:
-        background_tasks.add_task(crawl_domain_headless, domain)
+        background_tasks.add_task(crawl_domain_headless, domain, request.block_resources)
 
     return {"message": "Crawling started for provided domains."}
 
@@ -387,13 +673,7 @@ async def download_results(domain: str):
         domain: The domain to download the results for.
     """
     # File name
-    domain_part = domain.replace("https://", "").replace("http://", "")
-    try:
-        filename_part = domain_part.split(".")[1]
-    except IndexError:
-        filename_part = domain_part
-
-    file_name = os.path.join(OUTPUT_DIR, f"{filename_part}.txt")
+    file_name = output_file_for(domain)
     if os.path.exists(file_name):
         return FileResponse(file_name, filename=file_name)
     else: